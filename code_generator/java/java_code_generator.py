@@ -1,20 +1,105 @@
+# Cache of indent strings indexed by tab count, grown lazily as deeper tabs are requested
+_INDENT_CACHE = ["", "    ", "        ", "            "]
+
+
+# Longest possible divider character runs, sliced to size when comment borders are built
+_DASH_RUN = "-" * 118
+_HASH_RUN = "#" * 118
+_EQ_RUN = "=" * 118
+
+# Pre-built modifier prefixes keyed by (public, static) for method signatures and by abstract for class definitions
+_METHOD_MODIFIERS = {(True, True): "public static ",
+                     (True, False): "public ",
+                     (False, True): "private static ",
+                     (False, False): "private "}
+_CLASS_MODIFIERS = {True: "public abstract class ", False: "public class "}
+
+# Rendered method blocks keyed by their full content, so identical boilerplate methods render once
+_RENDER_CACHE = {}
+
+# Fixed-shape line templates, bound once so each render is a single substitution call
+_METHOD_SIG_TEMPLATE = "{modifiers}{return_type}{name}({params}) {{".format
+_CLASS_DEF_TEMPLATE = "{modifiers}{name}{extends}{implements} {{".format
+
+
+def _indent(tabs):
+    """
+    Get the indent string for a number of tabs
+
+    Args:
+        tabs (int):             The number of tabs to indent by
+
+    Returns:
+        The indent string made up of 4 spaces per tab
+    """
+    while tabs >= len(_INDENT_CACHE):
+        _INDENT_CACHE.append(_INDENT_CACHE[-1] + "    ")
+    return _INDENT_CACHE[tabs]
+
+
+def _build_line(indent, text, code):
+    """
+    Assemble a single finished output line. This is the one place indent, text and line ending are combined
+
+    Args:
+        indent (str):   The indent to put in front of the line
+        text (str):     The line of text to write
+        code (bool):    True if the line is code and may need a closing ;
+
+    Returns:
+        The finished line including the end of line
+    """
+    if code and not (text.endswith(("{", "}", ";")) or text.startswith("//")):
+        return f"{indent}{text};\n"
+    return f"{indent}{text}\n"
+
+
+class _StreamLines:
+    """
+    An adapter exposing the line list interface the write methods use while streaming every line straight to an
+    open text target, so no intermediate list is ever materialized
+
+    Attributes:
+        append (method):    The write method of the target, called once per line
+        extend (method):    The writelines method of the target, called once per batch of lines
+    """
+
+    __slots__ = ("append", "extend")
+
+    def __init__(self, out):
+        """
+        Constructor
+
+        Args:
+            out:    Any object with write/writelines methods, typically an open file
+        """
+        self.append = out.write
+        self.extend = out.writelines
+
+
 class WritableSection:
     """
     A shared interface to allow interchangeable blocks of code to be written to a file
 
     Attributes:
         _file_lines (list[str]):                The lines that will be written to file (set at write time)
+        _append (method):                       Bound append of _file_lines, rebound at write time
         _tab_offset (int):                      The number of tabs that the class should be offset by, set at write time
+        _indent (str):                          The indent string matching _tab_offset (set at write time)
         _sections (list[str/WritableSection]):  The lines or other sections to write
         code_lines (bool):                     Are the lines code (with a ;) or not (does not effect nested sections)
     """
 
+    __slots__ = ("_file_lines", "_append", "_tab_offset", "_indent", "_sections", "code_lines")
+
     def __init__(self):
         """
         Constructor
         """
         self._file_lines = []
+        self._append = self._file_lines.append
         self._tab_offset = 0
+        self._indent = ""
         self._sections = []
         self.code_lines = True
 
@@ -27,6 +112,25 @@ class WritableSection:
         """
         self._sections.append(section)
 
+    def extend(self, sections):
+        """
+        Add several sections at once
+
+        Args:
+            sections (list[str/WritableSection]):   The lines or WritableSections to add
+        """
+        self._sections.extend(sections)
+
+    def append_block(self, lines):
+        """
+        Add a pre-formatted block of lines written verbatim (indented, but with no ; handling). Cheaper than nesting a
+        WritableSection when the block is just a fixed run of lines
+
+        Args:
+            lines (tuple[str]): The lines of the block, in order
+        """
+        self._sections.append(tuple(lines))
+
     def insert(self, index, section):
         """
         Insert a section at a specific index
@@ -45,38 +149,77 @@ class WritableSection:
         Returns:
             True if the core sections to write are empty
         """
-        return len(self._sections) == 0
+        return not self._sections
 
     def write(self, file_lines, tab_offset):
         """
         Add the sections and/or lines to an output list to write to a file
 
+        Args:
+            file_lines (list[str]): OUT The lines to write
+            tab_offset (int):       The number of tabs that the class should be offset by
+        """
+        self._begin_write(file_lines, tab_offset)
+        self._write_section()
+
+    def write_to(self, out, tab_offset=0):
+        """
+        Stream the section directly to a writable text target, bypassing the intermediate line list
+
+        Args:
+            out:                Any object with write/writelines methods, typically an open file
+            tab_offset (int):   The number of tabs that the class should be offset by
+        """
+        self.write(_StreamLines(out), tab_offset)
+
+    def _begin_write(self, file_lines, tab_offset):
+        """
+        Store the output target and precompute the indent string ahead of writing lines
+
         Args:
             file_lines (list[str]): OUT The lines to write
             tab_offset (int):       The number of tabs that the class should be offset by
         """
         self._file_lines = file_lines
+        self._append = file_lines.append
         self._tab_offset = tab_offset
-        self._write_section()
+        self._indent = _indent(tab_offset)
 
     def _write_section(self, tab_delta=0):
         old_tab = self._tab_offset
-        self._tab_offset += tab_delta
+        tab = old_tab + tab_delta
+        self._tab_offset = tab
+        indent = self._indent = _indent(tab)
+        file_lines = self._file_lines
+        code = self.code_lines
+
+        # Batch consecutive plain lines into one string, flushing around nested sections
+        buf = []
         for line in self._sections:
-            if issubclass(type(line), WritableSection):
-                line.write(self._file_lines, self._tab_offset)
-            else:
-                if self.code_lines:
-                    self._add_code_line(line)
+            if isinstance(line, str):
+                if line:
+                    buf.append(_build_line(indent, line, code))
                 else:
-                    self._add_line(line)
+                    buf.append("\n")
+            elif isinstance(line, tuple):
+                for raw in line:
+                    buf.append(_build_line(indent, raw, False) if raw else "\n")
+            else:
+                if buf:
+                    file_lines.append("".join(buf))
+                    buf = []
+                line.write(file_lines, tab)
+        if buf:
+            file_lines.append("".join(buf))
+
         self._tab_offset = old_tab
+        self._indent = _indent(old_tab)
 
     def _blank_line(self):
         """
         Add a blank line
         """
-        self._file_lines.append('\n')
+        self._append('\n')
 
     def _add_code_line(self, text, tabs=0):
         """
@@ -86,17 +229,9 @@ class WritableSection:
             text(str):              The line of text to write
             tabs (int):             The number of tabs to write above the base tab offset of this section
         """
-        line = ""
         if len(text) != 0:
-            for x in range(self._tab_offset + tabs):
-                line += "    "
-            line += text
-            if text.endswith("{") or text.endswith("}") or text.startswith("//") or text.endswith(";") or len(
-                    text) == 0:
-                line += "\n"
-            else:
-                line += ";\n"
-            self._file_lines.append(line)
+            indent = self._indent if tabs == 0 else _indent(self._tab_offset + tabs)
+            self._append(_build_line(indent, text, True))
         else:
             self._blank_line()
 
@@ -108,13 +243,9 @@ class WritableSection:
             text(str):              The line of text to write
             tabs (int):             The number of tabs to write above the base tab offset of this section
         """
-        line = ""
         if len(text) != 0:
-            for x in range(self._tab_offset + tabs):
-                line += "    "
-            line += text
-            line += '\n'
-            self._file_lines.append(line)
+            indent = self._indent if tabs == 0 else _indent(self._tab_offset + tabs)
+            self._append(_build_line(indent, text, False))
         else:
             self._blank_line()
 
@@ -129,6 +260,8 @@ class JavaFile(WritableSection):
         javaClass (JavaClass): The main class of the file matching the name of the file
     """
 
+    __slots__ = ("_name", "_package", "javaClass")
+
     def __init__(self, name, package):
         """
         Constructor
@@ -143,9 +276,19 @@ class JavaFile(WritableSection):
         self._package = package
         self.javaClass = JavaClass(name)
 
+    def render(self):
+        """
+        Render the whole file as a single string, ready for one write call to disk
+
+        Returns:
+            The full text of the file
+        """
+        file_lines = []
+        self.write(file_lines, 0)
+        return "".join(file_lines)
+
     def write(self, file_lines, tab_offset):
-        self._file_lines = file_lines
-        self._tab_offset = tab_offset
+        self._begin_write(file_lines, tab_offset)
 
         # Add the package
         self._add_code_line("package " + self._package)
@@ -170,6 +313,8 @@ class JavaClass(WritableSection):
         implements (list[str]): The classes this class implements
     """
 
+    __slots__ = ("_name", "abstract", "extensions", "implements")
+
     def __init__(self, name):
         """
         Constructor
@@ -184,8 +329,7 @@ class JavaClass(WritableSection):
         self.implements = None
 
     def write(self, file_lines, tab_offset):
-        self._file_lines = file_lines
-        self._tab_offset = tab_offset
+        self._begin_write(file_lines, tab_offset)
 
         self._blank_line()
         self._add_class_definition()
@@ -194,18 +338,11 @@ class JavaClass(WritableSection):
         self._add_line("}")
 
     def _add_class_definition(self):
-        class_line = "public "
-        if self.abstract:
-            class_line += "abstract "
-        class_line += "class " + self._name
-        if self.extensions is not None:
-            class_line += " extends "
-            class_line += self.extensions
-        if self.implements is not None:
-            class_line += " implements "
-            class_line += self.implements
-        class_line += " {"
-        self._add_line(class_line)
+        self._add_line(_CLASS_DEF_TEMPLATE(
+            modifiers=_CLASS_MODIFIERS[self.abstract],
+            name=self._name,
+            extends=" extends " + self.extensions if self.extensions is not None else "",
+            implements=" implements " + self.implements if self.implements is not None else ""))
 
 
 class SectionComment(WritableSection):
@@ -213,9 +350,14 @@ class SectionComment(WritableSection):
     A comment section used to divide groups of methods to write to the file
 
     Attributes:
-        _comment (str): The comment to write
+        _comment (str):         The comment to write
+        _cached_offset (int):   The tab offset the cached border lines were built for
+        _line (str):            The cached border line
+        _center (str):          The cached center line containing the comment
     """
 
+    __slots__ = ("_comment", "_cached_offset", "_line", "_center")
+
     def __init__(self, comment):
         """
         Constructor
@@ -225,34 +367,29 @@ class SectionComment(WritableSection):
         """
         super().__init__()
         self._comment = comment
+        self._cached_offset = None
+        self._line = None
+        self._center = None
 
     def write(self, file_lines, tab_offset):
-        self._file_lines = file_lines
-        self._tab_offset = tab_offset
+        self._begin_write(file_lines, tab_offset)
 
         # Separate
         self._blank_line()
 
-        # Method comment
-        line_size = 118 - (4 * self._tab_offset)
-        pad_size = int((line_size - (len(self._comment) + 2)) / 2)
+        # Method comment, rebuilt only when the tab offset changes
+        if self._cached_offset != tab_offset:
+            line_size = 118 - (4 * tab_offset)
+            pad_size = max(int((line_size - (len(self._comment) + 2)) / 2), 0)
 
-        line = "//"
-        for x in range(line_size):
-            line += "-"
+            self._line = "//" + _DASH_RUN[:line_size]
+            self._center = "//" + _HASH_RUN[:pad_size] + " " + self._comment + " " + _HASH_RUN[:pad_size]
+            if ((pad_size * 2) + 2 + len(self._comment)) != line_size:
+                self._center += "#"
+            self._cached_offset = tab_offset
 
-        center_line = "//"
-        for x in range(pad_size):
-            center_line += "#"
-        center_line += (" " + self._comment + " ")
-        for x in range(pad_size):
-            center_line += "#"
-        if ((pad_size * 2) + 2 + len(self._comment)) != line_size:
-            center_line += "#"
-
-        self._add_line(line)
-        self._add_line(center_line)
-        self._add_line(line)
+        border = self._indent + self._line + "\n"
+        self._file_lines.extend((border, self._indent + self._center + "\n", border))
 
 
 class DividerComment(WritableSection):
@@ -260,9 +397,13 @@ class DividerComment(WritableSection):
     A comment section used to divide groups of lines to write to the file
 
     Attributes:
-        _comment (str): The comment to write
+        _comment (str):         The comment to write
+        _cached_offset (int):   The tab offset the cached line was built for
+        _center (str):          The cached divider line
     """
 
+    __slots__ = ("_comment", "_cached_offset", "_center")
+
     def __init__(self, comment=""):
         """
         Constructor
@@ -272,24 +413,26 @@ class DividerComment(WritableSection):
         """
         super().__init__()
         self._comment = comment
+        self._cached_offset = None
+        self._center = None
 
     def write(self, file_lines, tab_offset):
-        self._file_lines = file_lines
-        self._tab_offset = tab_offset
+        self._begin_write(file_lines, tab_offset)
 
-        # Method comment
-        line_size = 118 - (4 * self._tab_offset)
-        pad_size = int((line_size - (len(self._comment)))) - 2
+        # Method comment, rebuilt only when the tab offset changes
+        if self._cached_offset != tab_offset:
+            line_size = 118 - (4 * tab_offset)
+            pad_size = max(int((line_size - (len(self._comment)))) - 2, 0)
 
-        center_line = "//"
-        if len(self._comment) != 0:
-            center_line += (" " + self._comment + " ")
-        else:
-            center_line += "=="
-        for x in range(pad_size):
-            center_line += "="
+            center_line = "//"
+            if len(self._comment) != 0:
+                center_line += (" " + self._comment + " ")
+            else:
+                center_line += "=="
+            self._center = center_line + _EQ_RUN[:pad_size]
+            self._cached_offset = tab_offset
 
-        self._add_line(center_line)
+        self._add_line(self._center)
 
 
 class BlockComment(WritableSection):
@@ -300,6 +443,8 @@ class BlockComment(WritableSection):
         _lines (list[str]): The lines of the comment block
     """
 
+    __slots__ = ("_lines",)
+
     def __init__(self):
         super().__init__()
         self._lines = []
@@ -315,14 +460,14 @@ class BlockComment(WritableSection):
         self._lines.append(section)
 
     def write(self, file_lines, tab_offset):
-        self._file_lines = file_lines
-        self._tab_offset = tab_offset
+        self._begin_write(file_lines, tab_offset)
 
         if len(self._lines) != 0:
-            self._add_line("/**")
-            for line in self._lines:
-                self._add_line(" * " + line)
-            self._add_line(" */")
+            indent = self._indent
+            block = [indent + "/**\n"]
+            block.extend(indent + " * " + line + "\n" for line in self._lines)
+            block.append(indent + " */\n")
+            self._file_lines.extend(block)
 
 
 class JavaMethod(WritableSection):
@@ -339,6 +484,8 @@ class JavaMethod(WritableSection):
         return_type (str):                      The return type of the method
     """
 
+    __slots__ = ("_name", "static", "public", "comment", "attributes", "param", "return_type")
+
     def __init__(self, name):
         """
         Constructor
@@ -356,8 +503,37 @@ class JavaMethod(WritableSection):
         self.return_type = None
 
     def write(self, file_lines, tab_offset):
-        self._file_lines = file_lines
-        self._tab_offset = tab_offset
+        cache_key = self._cache_key(tab_offset)
+        if cache_key is None:
+            self._write_method(file_lines, tab_offset)
+            return
+
+        block = _RENDER_CACHE.get(cache_key)
+        if block is None:
+            buffer = []
+            self._write_method(buffer, tab_offset)
+            block = "".join(buffer)
+            _RENDER_CACHE[cache_key] = block
+        file_lines.append(block)
+
+    def _cache_key(self, tab_offset):
+        """
+        Build the key used to cache the rendered method. Methods containing nested sections are not cached
+
+        Args:
+            tab_offset (int):   The number of tabs that the method will be offset by
+
+        Returns:
+            A hashable key describing the full method, or None if the method can not be cached
+        """
+        for section in self._sections:
+            if isinstance(section, WritableSection):
+                return None
+        return (tab_offset, self._name, self.public, self.static, self.return_type, self.code_lines,
+                tuple(self.param), tuple(self.attributes), tuple(self.comment._lines), tuple(self._sections))
+
+    def _write_method(self, file_lines, tab_offset):
+        self._begin_write(file_lines, tab_offset)
 
         self._blank_line()
         self.comment.write(self._file_lines, self._tab_offset)
@@ -368,27 +544,11 @@ class JavaMethod(WritableSection):
 
     def _add_attributes(self):
         if len(self.attributes) != 0:
-            atr_line = ""
-            for line in self.attributes:
-                atr_line += line
-            self._add_line(atr_line)
+            self._add_line("".join(self.attributes))
 
     def _add_method_signature(self):
-        method_line = ""
-        if self.public:
-            method_line += "public "
-        else:
-            method_line += "private "
-        if self.static:
-            method_line += "static "
-        if self.return_type is not None:
-            method_line += self.return_type + " "
-        method_line += self._name + "("
-        i = 0
-        for param in self.param:
-            method_line += param
-            if (i + 1) != len(self.param):
-                method_line += ", "
-            i += 1
-        method_line += ") {"
-        self._add_line(method_line)
+        self._add_line(_METHOD_SIG_TEMPLATE(
+            modifiers=_METHOD_MODIFIERS[(self.public, self.static)],
+            return_type=self.return_type + " " if self.return_type is not None else "",
+            name=self._name,
+            params=", ".join(self.param)))
@@ -1,6 +1,106 @@
-import code_generator.java.java_code_generator
+import hashlib
+import sys
+
 from code_generator.java.java_code_generator import *
 
+# Field names a FileInterface class must provide, all overriding the interface getters
+_FILE_INTERFACE_OVERRIDES = {"FileName", "ContainerPath", "FullPath"}
+
+# Default values merged into every class definition and every field before generation
+_CLASS_DEFAULTS = {'abstract': False,
+                   'implements': None,
+                   'listDef': False}
+_FIELD_DEFAULTS = {'string_source': False,
+                   'editable': False,
+                   'avoid_constructor': False,
+                   'database_source': False,
+                   'is_override': False,
+                   'canBeNull': False,
+                   'is_list': False,
+                   'isDefault': False,
+                   'isSpecial': False,
+                   'fieldType': "DataField_Schema"}
+
+
+def _lcfirst(name):
+    """
+    Lowercase the first character of a field name, skipping the Unicode-aware str.lower machinery for the common
+    uppercase-ASCII case
+
+    Args:
+        name (str): The field name to convert
+
+    Returns:
+        The name with its first character lowercased
+    """
+    if not name:
+        return name
+    first = name[0]
+    if 'A' <= first <= 'Z':
+        return chr(ord(first) | 0x20) + name[1:]
+    return name[:1].lower() + name[1:]
+
+
+def _data_core_static(section, field, key, static, class_name):
+    section.append(
+        f"dataObjectSchema.get({key}).setDataCore_schema(createStaticDataCore({static['value']}))")
+
+
+def _data_core_instance_static(section, field, key, static, class_name):
+    field_type = field['type']
+    if 'specialKey' in static:
+        section.append(
+            f"dataObjectSchema.<{field_type}>get({key}).setDataCore_schema("
+            f"createStaticObjectDataCore({field_type}.class, {static['specialKey']}))")
+    else:
+        section.append(
+            f"dataObjectSchema.<{field_type}>get({key}).setDataCore_schema("
+            f"createStaticObjectDataCore({field_type}.class))")
+
+
+def _data_core_derived(section, field, key, derived, class_name):
+    lines = [f"dataObjectSchema.<{field['type']}>get({key}).setDataCore_schema(",
+             f"        new Derived_DataCore_Schema<{field['type']}, {class_name}>",
+             f"                (container -> {derived['codeLine']}"]
+    for source in derived['sources']:
+        lines.append("                        , " + source)
+    lines[-1] += "));"
+
+    section.append_block(lines)
+
+
+def _data_core_self_parent(section, field, key, self_parent, class_name):
+    section.append_block((
+        f"dataObjectSchema.<List<{field['getType']}>>get({key}).setDataCore_schema(",
+        f"        createSelfParentList({self_parent['classType']}.class, null));"))
+
+
+def _data_core_direct_derived(section, field, key, direct_derived, class_name):
+    if "defaultGetter" in direct_derived:
+        section.append_block((
+            f"dataObjectSchema.<{field['getType']}>get({key}).setDataCore_schema(",
+            f"        createDirectDerivedDataCore(container -> {direct_derived['defaultGetter']},",
+            f"                {direct_derived['sources']}));"))
+    else:
+        section.append_block((
+            f"dataObjectSchema.<{field['getType']}>get({key}).setDataCore_schema(",
+            f"        createDirectDerivedDataCore({direct_derived['sources']}));"))
+
+
+def _data_core_multi_parent_list(section, field, key, multi_parent_list, class_name):
+    section.append_block((
+        f"dataObjectSchema.<List<{field['getType']}>>get({key}).setDataCore_schema(",
+        f"        createMultiParentList({field['getType']}.class, {multi_parent_list['parents']}));"))
+
+
+# Emitters for each dataCore variant, dispatched on the single key of the dataCore object
+_DATA_CORE_HANDLERS = {'static': _data_core_static,
+                       'instanceStatic': _data_core_instance_static,
+                       'derived': _data_core_derived,
+                       'selfParent': _data_core_self_parent,
+                       'directDerived': _data_core_direct_derived,
+                       'multiParentList': _data_core_multi_parent_list}
+
 
 class ClassGenerator:
     """
@@ -15,6 +115,9 @@ class ClassGenerator:
         _fields (list[dict]):               The fields to be writen
         _class_dict (dict{ClassGenerator}): A dict containing all ClassGenerator found in the package mapped to there
                                             class name
+        _extends_ref (ClassGenerator):      The generator of the parent class, resolved once the class dict is full
+        json_hash (str):                    The sha256 of the JSON input, recorded by the driver after parsing
+        _string_source (dict):              The first field flagged as the toString source, if any
         _follow_field (dict)                The field that any new fields should follow to maintain the intended order
         _full_fields (list(dict))           All fields in order that this class can use, including its own and parents
     """
@@ -36,71 +139,71 @@ class ClassGenerator:
         self.field_prefix = self.class_name + "_Prefix"
         self._fields = self._json_data['fields']
         self._class_dict = class_dict
+        self._extends_ref = None
+        self.json_hash = None
+        self._string_source = None
         self._follow_field = None
         self._full_fields = []
 
         self.file = JavaFile(class_name, package)
 
         # Populate optional parameters with defaults
-        if 'abstract' not in self._json_data:
-            self._json_data['abstract'] = False
-        if 'implements' not in self._json_data:
-            self._json_data['implements'] = None
-        if 'listDef' not in self._json_data:
-            self._json_data['listDef'] = False
+        for key, value in _CLASS_DEFAULTS.items():
+            self._json_data.setdefault(key, value)
 
         # For all fields, populate optional parameters with default
+        key_prefix = class_name + "_"
         for field in self._fields:
-            field['key'] = class_name + "_" + field['name']
-            if 'string_source' not in field:
-                field['string_source'] = False
-            if 'editable' not in field:
-                field['editable'] = False
-            if 'avoid_constructor' not in field:
-                field['avoid_constructor'] = False
-            if 'database_source' not in field:
-                field['database_source'] = False
-            if 'is_override' not in field:
-                field['is_override'] = False
-            if 'canBeNull' not in field:
-                field['canBeNull'] = False
-            if 'is_list' not in field:
-                field['is_list'] = False
-            if 'isDefault' not in field:
-                field['isDefault'] = False
-            if 'isSpecial' not in field:
-                field['isSpecial'] = False
+            name = field['name'] = sys.intern(field['name'])
+            field['key'] = sys.intern(key_prefix + name)
+            field['lower_name'] = sys.intern(_lcfirst(name))
+            field['getter_name'] = "get" + name
+            field['setter_name'] = "set" + name
+            for key, value in _FIELD_DEFAULTS.items():
+                field.setdefault(key, value)
             if 'type' not in field:
                 if 'listType' not in field:
                     raise Exception("Either type or listType must be declared in the JSON file")
-                field['type'] = field['listType'] + "List"
-                field['getType'] = "List<" + field['listType'] + ">"
+                field['type'] = sys.intern(field['listType'] + "List")
+                field['getType'] = sys.intern("List<" + field['listType'] + ">")
             else:
-                field['getType'] = field['type']
-            if 'fieldType' not in field:
-                field['fieldType'] = "DataField_Schema"
+                field['getType'] = field['type'] = sys.intern(field['type'])
+            if 'dataCore' in field:
+                field['avoid_constructor'] = True
+            if field['string_source'] and self._string_source is None:
+                self._string_source = field
 
         if self._json_data['implements'] == "FileInterface":
-            name_found = False
-            path_found = False
-            full_path_found = False
+            found = set()
             for field in self._fields:
-                if field['name'] == "FileName":
-                    name_found = True
+                if field['name'] in _FILE_INTERFACE_OVERRIDES:
                     field['is_override'] = True
-                if field['name'] == "ContainerPath":
-                    path_found = True
-                    field['is_override'] = True
-                if field['name'] == "FullPath":
-                    full_path_found = True
-                    field['is_override'] = True
-            if not name_found or not path_found or not full_path_found:
+                    found.add(field['name'])
+            if found != _FILE_INTERFACE_OVERRIDES:
                 raise Exception("FileInterface methods missing")
 
-        # TODO remove
-        for field in self._json_data['fields']:
-            if 'dataCore' in field:
-                field['avoid_constructor'] = True
+    def resolve_extends(self):
+        """
+        Pre-resolve the generator of the parent class. Must be called once all files have been parsed and the class
+        dict is fully populated
+        """
+        self._extends_ref = self._class_dict[self._json_data['extends']]
+
+    def get_input_hash(self):
+        """
+        Get a hash covering this class's JSON input and that of every ancestor. Parent fields flow into the generated
+        output of their children, so a change to any class in the extends chain must also mark the children as
+        changed. Must be called after resolve_extends
+
+        Returns:
+            The combined hash of the full extends chain, or None if json_hash was never recorded
+        """
+        if self.json_hash is None:
+            return None
+        parent_hash = self._extends_ref.get_input_hash()
+        if parent_hash is None:
+            return self.json_hash
+        return hashlib.sha256((parent_hash + self.json_hash).encode()).hexdigest()
 
     def get_full_field_list(self):
         """
@@ -108,27 +211,35 @@ class ClassGenerator:
 
         Returns:
             A tuple consisting of the field that any children objects should follow and a list of all the fields this
-            object knows about
+            object knows about. The list is shared between calls and must not be mutated by the caller
         """
         if self._follow_field is None:
-            self._follow_field, self._full_fields = self._class_dict[
-                self._json_data['extends']].get_full_field_list()
+            parent = self._extends_ref
+            if parent is None:
+                parent = self._class_dict[self._json_data['extends']]
+            parent_follow, parent_fields = parent.get_full_field_list()
+            self._follow_field = parent_follow
+            self._full_fields = list(parent_fields)
+            index = self._full_fields.index(self._follow_field) + 1
             for field in self._fields:
-                self._full_fields.insert(self._full_fields.index(self._follow_field) + 1, field)
+                self._full_fields.insert(index, field)
+                index += 1
                 self._follow_field = field
 
-        return self._follow_field, self._full_fields.copy()
+        return self._follow_field, self._full_fields
 
     def process_existing_file(self, file_lines):
         """
-        Read the existing generated file to extract any needed data
+        Read the existing generated file to extract any needed data. Only the head of the file up to the end of the
+        import block is ever consumed, so the lines can be streamed straight from the open file
 
         Args:
-            file_lines (list[str]): The lines of the previously generated file
+            file_lines (iterable[str]): The lines of the previously generated file
         """
         add_blank = False
         imports_start = False
         for line in file_lines:
+            line = line.rstrip()
             if line.startswith("import"):
                 imports_start = True
                 if add_blank:
@@ -152,59 +263,71 @@ class ClassGenerator:
 
         # Finalise self
         self.get_full_field_list()
+        json_data = self._json_data
+        abstract = json_data['abstract']
 
         # Populate the header of the file
-        self.file.javaClass.extensions = self._json_data['extends']
-        self.file.javaClass.implements = self._json_data['implements']
+        self.file.javaClass.extensions = json_data['extends']
+        self.file.javaClass.implements = json_data['implements']
 
         # Create the core class
         java_class = self.file.javaClass
-        java_class.abstract = self._json_data['abstract']
+        java_class.abstract = abstract
 
-        # Prepare each of the key sections
+        # Prepare each of the key sections, skipping the ones no field can contribute to
+        fields = self._fields
         keys = self._Keys(self)
         definitions = self._Definitions(self)
         properties = self._Properties(self)
         constructor = self._Constructor(self)
-        implements = self._Implements(self)
         getters = self._Getters(self)
-        setters = self._Setters(self)
+        implements = self._Implements(self) if any(field['is_override'] for field in fields) else None
+        setters = self._Setters(self) if any(field['editable'] for field in fields) else None
 
         # Group all sections for convenience
-        sections = [keys, definitions, properties, constructor, implements, getters, setters]
+        sections = [keys, definitions, properties, constructor, getters]
+        if implements is not None:
+            sections.append(implements)
+        if setters is not None:
+            sections.append(setters)
+        own_ids = {id(field) for field in self._fields}
+        add_fields = [section.add_field for section in sections]
+        add_virtual_fields = [section.add_virtual_field for section in sections]
         for field in self._full_fields:
-            if field in self._fields:
-                for section in sections:
-                    section.add_field(field)
+            if id(field) in own_ids:
+                for add_field in add_fields:
+                    add_field(field)
             else:
-                for section in sections:
-                    section.add_virtual_field(field)
+                for add_virtual_field in add_virtual_fields:
+                    add_virtual_field(field)
 
         # Add all code
-        if self._json_data['listDef']:
+        if json_data['listDef']:
             list_def_section = WritableSection()
             list_def_section.code_lines = False
-            list_def_section.append(
-                "public interface " + self.class_name + "List extends List<" + self.class_name + "> {")
-            list_def_section.append("}")
-            list_def_section.append("")
+            list_def_section.extend((
+                f"public interface {self.class_name}List extends List<{self.class_name}> {{",
+                "}",
+                ""))
             java_class.append(list_def_section)
         keys.add(java_class)
         self._add_schema_method(java_class, definitions, properties)
-        if not constructor.set_line.is_empty():
+        if constructor.has_args():
             self._add_min_constructor(java_class)
-        if not self._json_data['abstract']:
+        if not abstract:
             constructor.add(java_class)
         self._add_general_methods(java_class)
-        implements.add(java_class)
+        if implements is not None:
+            implements.add(java_class)
         getters.add(java_class)
-        setters.add(java_class)
+        if setters is not None:
+            setters.add(java_class)
 
         return self.file
 
     def _add_schema_method(self, java_class, definitions, properties):
         # Setup the method
-        schema_method = code_generator.java.java_code_generator.JavaMethod("getDataObjectSchema")
+        schema_method = JavaMethod("getDataObjectSchema")
         java_class.append(schema_method)
         schema_method.return_type = "DataObject_Schema"
         schema_method.static = True
@@ -212,7 +335,7 @@ class ClassGenerator:
 
         # Get the original schema to append
         schema_method.append(
-            "DataObject_Schema dataObjectSchema = " + self._json_data['extends'] + ".getDataObjectSchema()")
+            f"DataObject_Schema dataObjectSchema = {self._json_data['extends']}.getDataObjectSchema()")
         schema_method.append("")
 
         # Populate the definitions and properties as needed
@@ -221,9 +344,9 @@ class ClassGenerator:
 
         # Close the method
         if self._json_data['abstract']:
-            schema_method.append("return dataObjectSchema.endLayer(" + self.class_name + ".class)")
+            schema_method.append(f"return dataObjectSchema.endLayer({self.class_name}.class)")
         else:
-            schema_method.append("return dataObjectSchema.finaliseContainer(" + self.class_name + ".class)")
+            schema_method.append(f"return dataObjectSchema.finaliseContainer({self.class_name}.class)")
 
     def _add_min_constructor(self, java_class):
         constructor_method = JavaMethod(self.class_name)
@@ -241,18 +364,15 @@ class ClassGenerator:
             to_string_method.return_type = "String"
             to_string_method.comment.append("@inheritDoc")
             to_string_method.attributes.append("@Override")
-            to_string_method.append("return " + self._json_data['customToString'])
+            to_string_method.append(f"return {self._json_data['customToString']}")
+            section.append(to_string_method)
+        elif self._string_source is not None:
+            to_string_method = JavaMethod("toString")
+            to_string_method.return_type = "String"
+            to_string_method.comment.append("@inheritDoc")
+            to_string_method.attributes.append("@Override")
+            to_string_method.append(f"return {self._string_source['getter_name']}()")
             section.append(to_string_method)
-        else:
-            for field in self._fields:
-                if field['string_source']:
-                    to_string_method = JavaMethod("toString")
-                    to_string_method.return_type = "String"
-                    to_string_method.comment.append("@inheritDoc")
-                    to_string_method.attributes.append("@Override")
-                    to_string_method.append("return get" + field['name'] + "()")
-                    section.append(to_string_method)
-                    break
 
         if not section.is_empty():
             java_class.append(SectionComment("General"))
@@ -270,15 +390,13 @@ class ClassGenerator:
         def add_field(self, field):
             self._prefix_needed = True
             self._section.append(
-                "public static final String " + field['key'] + " = " + self._parent.field_prefix + " + \"" + field[
-                    'name'] + "\"")
+                f"public static final String {field['key']} = {self._parent.field_prefix} + \"{field['name']}\"")
 
         def add(self, java_class):
             if self._prefix_needed:
-                java_class.append(
-                    "private static final String " + self._parent.field_prefix + " = \"" +
-                    self._parent.class_name + "_\"")
-                java_class.append("")
+                java_class.extend((
+                    f"private static final String {self._parent.field_prefix} = \"{self._parent.class_name}_\"",
+                    ""))
             java_class.append(self._section)
 
     class _Definitions:
@@ -287,28 +405,26 @@ class ClassGenerator:
             self._section = WritableSection()
 
         def add_virtual_field(self, field):
-            self._section.append("// " + field['name'])
+            self._section.append(f"// {field['name']}")
             pass
 
         def add_field(self, field):
+            key = field['key']
+            field_type = field['type']
             if field['canBeNull']:
                 if field['is_list']:
                     self._section.append(
-                        "dataObjectSchema.add(new ListDataField_Schema<>(" + field['key'] + ", " + field[
-                            'type'] + "List.class, true))")
+                        f"dataObjectSchema.add(new ListDataField_Schema<>({key}, {field_type}List.class, true))")
                 else:
                     self._section.append(
-                        "dataObjectSchema.add(new DataField_Schema<>(" + field['key'] + ", " + field[
-                            'type'] + ".class, true))")
+                        f"dataObjectSchema.add(new DataField_Schema<>({key}, {field_type}.class, true))")
             else:
                 if field['is_list']:
                     self._section.append(
-                        "dataObjectSchema.add(new ListDataField_Schema<>(" + field['key'] + ", " + field[
-                            'type'] + "List.class))")
+                        f"dataObjectSchema.add(new ListDataField_Schema<>({key}, {field_type}List.class))")
                 else:
                     self._section.append(
-                        "dataObjectSchema.add(new DataField_Schema<>(" + field['key'] + ", " + field[
-                            'type'] + ".class))")
+                        f"dataObjectSchema.add(new DataField_Schema<>({key}, {field_type}.class))")
 
         def add(self, method):
             self._section.append("")
@@ -324,101 +440,32 @@ class ClassGenerator:
 
         def add_field(self, field):
             any_used = False
+            key = field['key']
             section = WritableSection()
             if 'attachedProperties' in field:
                 any_used = True
                 properties = field['attachedProperties']
-                for key in properties:
-                    for value in properties[key]:
+                for property_class in properties:
+                    for value in properties[property_class]:
                         section.append(
-                            "dataObjectSchema.get(" + field['key'] + ").getProperty(" + key + ".class)." + value)
+                            f"dataObjectSchema.get({key}).getProperty({property_class}.class).{value}")
             if field['editable']:
                 any_used = True
-                section.append("dataObjectSchema.get(" + field['key'] + ").setManualCanEdit(true)")
+                section.append(f"dataObjectSchema.get({key}).setManualCanEdit(true)")
             if field['isDefault']:
                 any_used = True
-                section.append("dataObjectSchema.get(" + field['key'] + ").setDefaultFlag(true)")
+                section.append(f"dataObjectSchema.get({key}).setDefaultFlag(true)")
             if field['isSpecial']:
                 any_used = True
-                section.append("dataObjectSchema.get(" + field['key'] + ").setSpecialFlag(true)")
+                section.append(f"dataObjectSchema.get({key}).setSpecialFlag(true)")
             if 'dataCore' in field:
                 any_used = True
                 data_core = field['dataCore']
-                if 'static' in data_core:
-                    static = data_core['static']
-                    section.append("dataObjectSchema.get(" + field[
-                        'key'] + ").setDataCore_schema(createStaticDataCore(" + static['value'] + "))")
-                elif 'instanceStatic' in data_core:
-                    static = data_core['instanceStatic']
-                    if 'specialKey' in static:
-                        section.append("dataObjectSchema.<" + field['type'] + ">get(" + field[
-                            'key'] + ").setDataCore_schema(createStaticObjectDataCore(" + field['type'] + ".class, " +
-                                       static['specialKey'] + "))")
-                    else:
-                        section.append("dataObjectSchema.<" + field['type'] + ">get(" + field[
-                            'key'] + ").setDataCore_schema(createStaticObjectDataCore(" + field['type'] + ".class))")
-                elif 'derived' in data_core:
-                    derived = data_core['derived']
-                    data_core_section = WritableSection()
-                    i = 0
-                    data_core_section.code_lines = False
-                    data_core_section.append(
-                        "dataObjectSchema.<" + field['type'] + ">get(" + field['key'] + ").setDataCore_schema(")
-                    data_core_section.append(
-                        "        new Derived_DataCore_Schema<" + field['type'] + ", " + self._parent.class_name + ">")
-                    data_core_section.append("                (container -> " + derived['codeLine'])
-                    for source in derived['sources']:
-                        line = "                        , " + source
-                        i += 1
-                        if i == len(derived['sources']):
-                            line += "));"
-                        data_core_section.append(line)
-
-                    section.append(data_core_section)
-                elif 'selfParent' in data_core:
-                    self_parent = data_core['selfParent']
-                    data_core_section = WritableSection()
-                    data_core_section.code_lines = False
-
-                    data_core_section.append(
-                        "dataObjectSchema.<List<" + field['getType'] + ">>get(" + field[
-                            'key'] + ").setDataCore_schema(")
-                    data_core_section.append(
-                        "        createSelfParentList(" + self_parent['classType'] + ".class, null));")
-                    section.append(data_core_section)
-                elif 'directDerived' in data_core:
-                    direct_derived = data_core['directDerived']
-                    data_core_section = WritableSection()
-                    data_core_section.code_lines = False
-
-                    data_core_section.append(
-                        "dataObjectSchema.<" + field['getType'] + ">get(" + field['key'] + ").setDataCore_schema(")
-                    if "defaultGetter" in direct_derived:
-                        data_core_section.append(
-                            "        createDirectDerivedDataCore(container -> " + str(
-                                direct_derived['defaultGetter']) + ",")
-                        data_core_section.append("                " + direct_derived['sources'] + "));")
-                    else:
-                        data_core_section.append(
-                            "        createDirectDerivedDataCore(" + direct_derived['sources'] + "));")
-                    section.append(data_core_section)
-                elif 'multiParentList' in data_core:
-                    multi_parent_list = data_core['multiParentList']
-                    data_core_section = WritableSection()
-                    data_core_section.code_lines = False
-
-                    data_core_section.append(
-                        "dataObjectSchema.<List<" + field['getType'] + ">>get(" + field[
-                            'key'] + ").setDataCore_schema(")
-                    # if "default" in data_core:
-                    data_core_section.append(
-                        "        createMultiParentList(" + field['getType'] + ".class, " + str(
-                            multi_parent_list['parents']) + "));")
-                    # else:
-                    #     data_core_section.append("        createDirectDerivedDataCore(" + data_core['sources'] + "));")
-                    section.append(data_core_section)
-                else:
+                kind = next(iter(data_core), None)
+                handler = _DATA_CORE_HANDLERS.get(kind)
+                if handler is None:
                     raise Exception("Unknown data core")
+                handler(section, field, key, data_core[kind], self._parent.class_name)
 
             if any_used:
                 section.insert(0, DividerComment(field['name']))
@@ -433,8 +480,7 @@ class ClassGenerator:
     class _Constructor:
         def __init__(self, parent):
             self._parent = parent
-            self._method = JavaMethod(self._parent.class_name)
-            self.set_line = WritableSection()
+            self._args = []
             self._database_source = None
 
         def add_virtual_field(self, field):
@@ -442,35 +488,32 @@ class ClassGenerator:
 
         def add_field(self, field):
             if not field['avoid_constructor']:
-                # self._database_source['name'][0].lower() + self._database_source['name'][1:]
-
-                self._method.param.append(field['type'] + " " + field['name'][0].lower() + field['name'][1:])
-                self.set_line.append("        , " + field['key'] + ", " + field['name'][0].lower() + field['name'][1:])
+                self._args.append((field['type'], field['lower_name'], field['key']))
                 if field['database_source']:
                     self._database_source = field
 
-        def add(self, java_class):
-            # if self._set_line.is_empty():
-            #     return
+        def has_args(self):
+            return bool(self._args)
 
-            # Setup the sections
-            self.set_line.code_lines = False
-            self._method.code_lines = False
-            self._method.comment.append("Constructor")
+        def add(self, java_class):
+            # Setup the method
+            method = JavaMethod(self._parent.class_name)
+            method.code_lines = False
+            method.comment.append("Constructor")
 
             # Build the method
             if self._database_source is not None:
-                self._method.append(
-                    "super(" + self._database_source['name'][0].lower() + self._database_source['name'][1:] +
-                    ".getTrackingDatabase()")
+                lines = [f"super({self._database_source['lower_name']}.getTrackingDatabase()"]
             else:
-                self._method.param.insert(0, "Database database")
-                self._method.append("super(database")
-            # self._method.append("setAllValues(DataObject_Id, getTrackingDatabase().getNextId()")
-            self._method.append(self.set_line)
-            self._method.append(");")
+                method.param.append("Database database")
+                lines = ["super(database"]
+            for field_type, lower_name, key in self._args:
+                method.param.append(f"{field_type} {lower_name}")
+                lines.append(f"        , {key}, {lower_name}")
+            lines.append(");")
+            method.extend(lines)
 
-            java_class.append(self._method)
+            java_class.append(method)
 
     class _Implements:
         def __init__(self, parent):
@@ -482,11 +525,11 @@ class ClassGenerator:
 
         def add_field(self, field):
             if field['is_override']:
-                getter_method = JavaMethod("get" + field['name'])
+                getter_method = JavaMethod(field['getter_name'])
                 getter_method.comment.append("@inheritDoc")
                 getter_method.attributes.append("@Override")
                 getter_method.return_type = field['type']
-                getter_method.append("return get(" + field['key'] + ")")
+                getter_method.append(f"return get({field['key']})")
                 self._methods.append(getter_method)
 
         def add(self, java_class):
@@ -504,12 +547,13 @@ class ClassGenerator:
 
         def add_field(self, field):
             if not field['is_override']:
-                getter_method = JavaMethod("get" + field['name'])
+                get_type = field['getType']
+                getter_method = JavaMethod(field['getter_name'])
                 if field['is_list']:
-                    getter_method.return_type = "List<" + field['getType'] + ">"
+                    getter_method.return_type = f"List<{get_type}>"
                 else:
-                    getter_method.return_type = field['getType']
-                getter_method.append("return get(" + field['key'] + ")")
+                    getter_method.return_type = get_type
+                getter_method.append(f"return get({field['key']})")
                 self._methods.append(getter_method)
 
         def add(self, java_class):
@@ -527,10 +571,11 @@ class ClassGenerator:
 
         def add_field(self, field):
             if field['editable']:
-                setter_method = JavaMethod("set" + field['name'])
+                lower_name = field['lower_name']
+                setter_method = JavaMethod(field['setter_name'])
                 setter_method.return_type = "void"
-                setter_method.param.append(field['type'] + " " + field['name'][0].lower() + field['name'][1:])
-                setter_method.append("set(" + field['key'] + ", " + field['name'][0].lower() + field['name'][1:] + ")")
+                setter_method.param.append(f"{field['type']} {lower_name}")
+                setter_method.append(f"set({field['key']}, {lower_name})")
                 self._methods.append(setter_method)
 
         def add(self, java_class):
@@ -562,5 +607,15 @@ class RootClassGenerator:
     def set_class_dict(self, class_dict):
         pass
 
+    def resolve_extends(self):
+        pass
+
+    def get_input_hash(self):
+        return None
+
     def get_full_field_list(self):
-        return self._follow_field, self._full_fields.copy()
+        """
+        See ClassGenerator.get_full_field_list. The returned list is shared between calls and must not be mutated by
+        the caller
+        """
+        return self._follow_field, self._full_fields
@@ -1,11 +1,22 @@
+import hashlib
 import json
 import os
 import sys
 import traceback
+from concurrent.futures import ThreadPoolExecutor
 from jsonschema import validate
 
 from java_object_utill.java_object_generator import ClassGenerator, RootClassGenerator
 
+# orjson parses notably faster and returns the same plain dicts; fall back to the standard library if not installed
+try:
+    import orjson as _json
+except ImportError:
+    _json = json
+
+# Records, per class, the hash of the JSON input and of the generated output so unchanged classes can be skipped
+MANIFEST_NAME = ".codegen_manifest.json"
+
 
 def parse_all_files(core_path, start_package, schema_path):
     try:
@@ -16,22 +27,39 @@ def parse_all_files(core_path, start_package, schema_path):
         f = open(schema_path, )
         schema = json.load(f)
 
-        for path, subdir, files in os.walk(core_path):
-            for name in files:
-                core_name, extension = os.path.splitext(name)
-                if extension == ".json":
-                    file = parse_file(core_name, path, start_package + path.replace(core_path, "").replace('\\', '.'),
-                                      java_files_dict, schema)
-                    java_files.append(file)
-                    java_files_dict[file.class_name] = file
+        # Collect all the files to parse
+        to_parse = [(core_name, path,
+                     start_package + path.replace(core_path, "").replace('\\', '.'))
+                    for path, core_name in iter_json_files(core_path)]
+
+        # Parse the files in parallel, each input is independent and the reads overlap
+        with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+            futures = [executor.submit(parse_file, core_name, path, package, java_files_dict, schema)
+                       for core_name, path, package in to_parse]
+            for future in futures:
+                file = future.result()
+                java_files.append(file)
+                java_files_dict[file.class_name] = file
 
     except Exception as e:
         traceback.print_exc()
         print(e)
         return
 
+    # Resolve each parent reference now that every class has been parsed
+    for java_file in java_files:
+        java_file.resolve_extends()
+
+    # Only regenerate classes whose input or output changed since the last run
+    manifest = load_manifest(core_path)
+    new_manifest = {}
     to_write = {}
     for java_file in java_files:
+        entry = manifest.get(java_file.class_name)
+        if entry is not None and entry.get('json') == java_file.get_input_hash() \
+                and hash_existing_file(java_file.java_path) == entry.get('output'):
+            new_manifest[java_file.class_name] = entry
+            continue
         try:
             to_write[java_file] = java_file.generate()
         except Exception as e:
@@ -39,8 +67,50 @@ def parse_all_files(core_path, start_package, schema_path):
             print(e)
             return
 
-    for java_file in java_files:
-        write_file(java_file.java_path, to_write[java_file])
+    for java_file, file in to_write.items():
+        output_hash = write_file(java_file.java_path, file)
+        new_manifest[java_file.class_name] = {'json': java_file.get_input_hash(), 'output': output_hash}
+
+    with open(os.path.join(core_path, MANIFEST_NAME), "w") as manifest_file:
+        json.dump(new_manifest, manifest_file, indent=2)
+
+
+def iter_json_files(root):
+    """
+    Recursively find all the .json definition files under a directory
+
+    Yields:
+        (path, core_name) tuples, one per definition file found
+    """
+    for entry in os.scandir(root):
+        if entry.is_dir(follow_symlinks=False):
+            yield from iter_json_files(entry.path)
+        elif entry.name.endswith(".json") and entry.name != MANIFEST_NAME:
+            yield root, entry.name[:-5]
+
+
+def load_manifest(core_path):
+    """
+    Load the manifest left by the previous run, or an empty one if missing or unreadable
+    """
+    manifest_path = os.path.join(core_path, MANIFEST_NAME)
+    try:
+        with open(manifest_path, "r") as manifest_file:
+            return json.load(manifest_file)
+    except (OSError, ValueError):
+        return {}
+
+
+def hash_existing_file(path):
+    """
+    Hash the current content of a generated file, or None if it does not exist. The file is read in text mode so
+    platform newline translation can not make the hash diverge from the one recorded at write time
+    """
+    try:
+        with open(path, "r") as existing_file:
+            return hashlib.sha256(existing_file.read().encode()).hexdigest()
+    except OSError:
+        return None
 
 
 def parse_file(core_name, path, package, java_files_dict, schema):
@@ -50,30 +120,39 @@ def parse_file(core_name, path, package, java_files_dict, schema):
     json_path = os.path.join(path, core_name + ".json")
 
     # Open the file and parse the JSON data
-    f = open(json_path, )
-    data = json.load(f)
+    with open(json_path, "rb") as f:
+        raw = f.read()
+    data = _json.loads(raw)
     validate(instance=data, schema=schema)
     gen = ClassGenerator(data, core_name, package.replace(".json", ""), java_path, java_files_dict)
+    gen.json_hash = hashlib.sha256(raw).hexdigest()
 
     # Parse the existing file if it exists for escape code
     if os.path.isfile(java_path):
-        java_file = open(java_path, )
-        with open(java_path, "r") as myFile:
-            lines = java_file.readlines()
-            lines = [line.rstrip() for line in lines]
-        gen.process_existing_file(lines)
+        with open(java_path, "r") as java_file:
+            gen.process_existing_file(java_file)
 
     # Generate the JavaObject
     return gen
 
 
 def write_file(java_path, file):
-    # Write the file
-    with open(java_path, "w") as myFile:
-        lines = []
-        file.write(lines, 0)
-        for line in lines:
-            myFile.write(line)
+    # Build the full output and skip the write entirely if the file already matches
+    content = file.render()
+    output_hash = hashlib.sha256(content.encode()).hexdigest()
+    try:
+        with open(java_path, "r") as existing_file:
+            if existing_file.read() == content:
+                return output_hash
+    except OSError:
+        pass
+
+    # Write via a temp file so a crash can not leave a partial file behind
+    temp_path = java_path + ".tmp"
+    with open(temp_path, "w") as myFile:
+        myFile.write(content)
+    os.replace(temp_path, java_path)
+    return output_hash
 
 
 # Press the green button in the gutter to run the script.